@@ -10548,10 +10548,11 @@ def _render_expr(expr, path, embedded_root):
     return foe.to_mongo(expr, prefix=prefix)
 
 
+_RANDOM_CHARS = string.ascii_lowercase + string.digits
+
+
 def _get_random_characters(n):
-    return "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(n)
-    )
+    return "".join(random.choices(_RANDOM_CHARS, k=n))
 
 
 def _get_non_none_value(values, level=0):
@@ -9,6 +9,7 @@ from collections import defaultdict
 import contextlib
 from datetime import datetime
 import fnmatch
+import functools
 import itertools
 import logging
 import numbers
@@ -136,7 +137,7 @@ def get_default_dataset_name():
     """
     now = datetime.now()
     name = now.strftime("%Y.%m.%d.%H.%M.%S")
-    if name in _list_datasets(include_private=True):
+    if dataset_exists(name):
         name = now.strftime("%Y.%m.%d.%H.%M.%S.%f")
 
     return name
@@ -154,13 +155,13 @@ def make_unique_dataset_name(root):
     if not root:
         return get_default_dataset_name()
 
+    # Probe candidate names individually rather than listing all datasets;
+    # each probe is an indexed lookup on the (unique) dataset name
     name = root
-    dataset_names = _list_datasets(include_private=True)
-
-    if name in dataset_names:
+    if dataset_exists(name):
         name += "_" + _get_random_characters(6)
 
-    while name in dataset_names:
+    while dataset_exists(name):
         name += _get_random_characters(1)
 
     return name
@@ -281,6 +282,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._annotation_cache = cachetools.LRUCache(5)
         self._brain_cache = cachetools.LRUCache(5)
         self._evaluation_cache = cachetools.LRUCache(5)
+        self._collection_cache = {}
+        self._collection_cache_client = None
 
         self._deleted = False
 
@@ -2554,14 +2557,32 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             msg = bwe.details["writeErrors"][0]["errmsg"]
             raise ValueError(msg) from bwe
 
+        frame_inserts = []
         for sample, d in zip(samples, dicts):
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
             if sample.media_type == fom.VIDEO:
-                sample.frames.save()
+                frame_inserts.extend(sample.frames._insert_replacements())
+
+        # Insert the frames of all videos in the batch in a single bulk write
+        if frame_inserts:
+            self._insert_frames(frame_inserts)
 
         return [str(d["_id"]) for d in dicts]
 
+    def _insert_frames(self, frame_inserts):
+        ops = [InsertOne(d) for _, d in frame_inserts]
+        foo.bulk_write(ops, self._frame_collection, ordered=False)
+
+        # Backing documents must be created after the write, since loading
+        # the dicts may modify their contents in-place
+        for frame, d in frame_inserts:
+            if isinstance(frame._doc, foo.NoDatasetFrameDocument):
+                doc = self._frame_dict_to_doc(d)
+                frame._set_backing_doc(doc, dataset=self)
+            else:
+                frame._doc.id = d["_id"]
+
     def _upsert_samples(
         self,
         samples,
@@ -2604,24 +2625,36 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         dicts = []
         ops = []
+        is_new = []
         for sample in samples:
             d = self._make_dict(sample, include_id=True)
             dicts.append(d)
 
             if sample.id:
                 ops.append(ReplaceOne({"_id": sample._id}, d, upsert=True))
+                is_new.append(False)
             else:
                 d.pop("_id", None)
                 ops.append(InsertOne(d))  # adds `_id` to dict
+                is_new.append(True)
 
         foo.bulk_write(ops, self._sample_collection, ordered=False)
 
-        for sample, d in zip(samples, dicts):
+        frame_inserts = []
+        for sample, d, _is_new in zip(samples, dicts, is_new):
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
 
             if sample.media_type == fom.VIDEO:
-                sample.frames.save()
+                if _is_new:
+                    frame_inserts.extend(sample.frames._insert_replacements())
+                else:
+                    sample.frames.save()
+
+        # Insert the frames of all new videos in the batch in a single bulk
+        # write
+        if frame_inserts:
+            self._insert_frames(frame_inserts)
 
     def _make_dict(self, sample, include_id=False):
         d = sample.to_mongo_dict(include_id=include_id)
@@ -5826,30 +5859,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         dataset.save()
 
-        def parse_sample(sd):
-            if rel_dir and not os.path.isabs(sd["filepath"]):
-                sd["filepath"] = os.path.join(rel_dir, sd["filepath"])
-
-            if (media_type == fom.VIDEO) or (
-                media_type == fom.GROUP
-                and fom.get_media_type(sd["filepath"]) == fom.VIDEO
-            ):
-                frames = sd.pop("frames", {})
-
-                if etau.is_str(frames):
-                    frames_path = os.path.join(frame_labels_dir, frames)
-                    frames = etas.load_json(frames_path).get("frames", {})
-
-                sample = fos.Sample.from_dict(sd)
-
-                for key, value in frames.items():
-                    sample.frames[int(key)] = fofr.Frame.from_dict(value)
-            else:
-                sample = fos.Sample.from_dict(sd)
-
-            return sample
+        parse_sample = functools.partial(
+            _parse_sample_dict,
+            media_type=media_type,
+            rel_dir=rel_dir,
+            frame_labels_dir=frame_labels_dir,
+        )
 
         samples = d["samples"]
+
         _samples = map(parse_sample, samples)
 
         dataset.add_samples(
@@ -5891,7 +5909,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         Returns:
             a :class:`Dataset`
         """
-        d = etas.load_json(path_or_str)
+        if os.path.isfile(path_or_str):
+            d = fou.read_json(path_or_str)
+        else:
+            d = etas.load_json(path_or_str)
+
         return cls.from_dict(
             d,
             name=name,
@@ -5962,6 +5984,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             _pipeline.extend(self._group_select_pipeline(group_slice))
 
         if attach_frames:
+            if pipeline:
+                # Optimization: apply any leading `$match` stages that only
+                # involve sample fields before looking up frames, so that
+                # frames are only attached to samples that pass the filters
+                num_matches = _count_leading_sample_matches(pipeline)
+                if num_matches > 0:
+                    _pipeline.extend(pipeline[:num_matches])
+                    pipeline = pipeline[num_matches:]
+
             _pipeline.extend(self._attach_frames_pipeline(support=support))
 
         if pipeline is not None:
@@ -6015,6 +6046,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             let = {"sample_id": "$_id"}
             match_expr = {"$eq": ["$$sample_id", "$_sample_id"]}
 
+        # The `(_sample_id, frame_number)` index serves both the match and the
+        # sort here, so the sort is not performed in-memory. It must be kept,
+        # since it is the only thing that guarantees frame order
         return [
             {
                 "$lookup": {
@@ -6174,7 +6208,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
     @property
     def _sample_collection(self):
-        return foo.get_db_conn()[self._sample_collection_name]
+        return self._get_collection(self._sample_collection_name)
 
     @property
     def _frame_collection_name(self):
@@ -6182,10 +6216,29 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
     @property
     def _frame_collection(self):
-        if self._frame_collection_name is None:
+        frame_collection_name = self._frame_collection_name
+        if frame_collection_name is None:
             return None
 
-        return foo.get_db_conn()[self._frame_collection_name]
+        return self._get_collection(frame_collection_name)
+
+    def _get_collection(self, collection_name):
+        # Handles are bound to the client that created them, so the cache is
+        # invalidated whenever the global client is replaced
+        client = foo.get_db_client()
+        if client is not self._collection_cache_client:
+            self._collection_cache.clear()
+            self._collection_cache_client = client
+
+        # Handles are keyed by the config that affects the connection so that
+        # runtime changes to the database or timezone are respected
+        key = (fo.config.database_name, fo.config.timezone, collection_name)
+        coll = self._collection_cache.get(key, None)
+        if coll is None:
+            coll = foo.get_db_conn()[collection_name]
+            self._collection_cache[key] = coll
+
+        return coll
 
     @property
     def _frame_indexes(self):
@@ -6228,7 +6281,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         expanded = False
 
         if not dynamic:
-            schema = self.get_field_schema(include_private=True)
+            schema = set(self.get_field_schema(include_private=True).keys())
+            frame_schema = None
+
+        # New fields are collected and then merged into the schema in a single
+        # call, rather than saving the dataset once per new field. Dynamic
+        # fields must be merged per sample/frame, since each value may
+        # contribute new embedded fields
+        new_fields = {}
+        new_frame_fields = {}
 
         for sample in samples:
             for field_name in sample._get_field_names(include_private=True):
@@ -6253,15 +6314,45 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                         field_name, default=value.name
                     )
                 else:
-                    expanded |= self._sample_doc_cls.add_implied_field(
-                        field_name, value, dynamic=dynamic, validate=False
-                    )
+                    new_fields[field_name] = value
 
                 if not dynamic:
-                    schema = self.get_field_schema(include_private=True)
+                    schema.add(field_name)
 
             if sample.media_type == fom.VIDEO:
-                expanded |= self._expand_frame_schema(sample.frames, dynamic)
+                if dynamic:
+                    for frame in sample.frames.values():
+                        expanded |= _merge_implied_fields(
+                            self._frame_doc_cls,
+                            _get_implied_values(frame),
+                            dynamic,
+                        )
+                else:
+                    if frame_schema is None:
+                        frame_schema = set(
+                            self.get_frame_field_schema(
+                                include_private=True
+                            ).keys()
+                        )
+
+                    for frame in sample.frames.values():
+                        new_frame_fields.update(
+                            _get_implied_values(frame, schema=frame_schema)
+                        )
+
+            if dynamic:
+                expanded |= _merge_implied_fields(
+                    self._sample_doc_cls, new_fields, dynamic
+                )
+                new_fields.clear()
+
+        if not dynamic:
+            expanded |= _merge_implied_fields(
+                self._sample_doc_cls, new_fields, dynamic
+            )
+            expanded |= _merge_implied_fields(
+                self._frame_doc_cls, new_frame_fields, dynamic
+            )
 
         if expanded:
             self._reload()
@@ -6272,37 +6363,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self.add_group_slice(slice_name, media_type)
 
-    def _expand_frame_schema(self, frames, dynamic):
-        if not dynamic:
-            schema = self.get_frame_field_schema(include_private=True)
-
-        expanded = False
-        for frame in frames.values():
-            for field_name in frame._get_field_names(include_private=True):
-                if field_name == "_id":
-                    continue
-
-                if not dynamic and field_name in schema:
-                    continue
-
-                value = frame[field_name]
-
-                if value is None:
-                    continue
-
-                expanded |= self._frame_doc_cls.add_implied_field(
-                    field_name, value, dynamic=dynamic, validate=False
-                )
-
-                if not dynamic:
-                    schema = self.get_frame_field_schema(include_private=True)
-
-        return expanded
-
     def _sample_dict_to_doc(self, d):
         try:
             return self._sample_doc_cls.from_dict(d, extended=False)
-        except:
+        except (moe.FieldDoesNotExist, moe.InvalidDocumentError):
             # The dataset's schema may have been changed in another process;
             # let's try reloading to see if that fixes things
             self.reload()
@@ -6312,7 +6376,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
     def _frame_dict_to_doc(self, d):
         try:
             return self._frame_doc_cls.from_dict(d, extended=False)
-        except:
+        except (moe.FieldDoesNotExist, moe.InvalidDocumentError):
             # The dataset's schema may have been changed in another process;
             # let's try reloading to see if that fixes things
             self.reload()
@@ -6320,16 +6384,16 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             return self._frame_doc_cls.from_dict(d, extended=False)
 
     def _validate_samples(self, samples):
-        schema = self.get_field_schema(include_private=True)
+        validators = _make_validators(
+            self.get_field_schema(include_private=True)
+        )
+        media_type = self.media_type
 
         for sample in samples:
-            if (
-                self.media_type != fom.GROUP
-                and sample.media_type != self.media_type
-            ):
+            if media_type != fom.GROUP and sample.media_type != media_type:
                 raise fom.MediaTypeError(
                     "Sample media type '%s' does not match dataset media type "
-                    "'%s'" % (sample.media_type, self.media_type)
+                    "'%s'" % (sample.media_type, media_type)
                 )
 
             non_existent_fields = None
@@ -6337,7 +6401,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
             for field_name, value in sample.iter_fields():
                 if isinstance(value, fog.Group):
-                    if self.media_type != fom.GROUP:
+                    if media_type != fom.GROUP:
                         raise ValueError(
                             "Only datasets with media type '%s' may contain "
                             "Group fields" % fom.GROUP
@@ -6369,22 +6433,30 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
                     found_group = True
 
-                field = schema.get(field_name, None)
-                if field is None:
+                validator = validators.get(field_name, None)
+                if validator is None:
                     if value is not None:
                         if non_existent_fields is None:
                             non_existent_fields = {field_name}
                         else:
                             non_existent_fields.add(field_name)
-                else:
-                    if value is not None or not field.null:
-                        try:
-                            field.validate(value)
-                        except Exception as e:
-                            raise ValueError(
-                                "Invalid value for field '%s'. Reason: %s"
-                                % (field_name, str(e))
-                            )
+
+                    continue
+
+                validate, null, trusted_type = validator
+                if value is None:
+                    if null:
+                        continue
+                elif type(value) is trusted_type:
+                    continue
+
+                try:
+                    validate(value)
+                except Exception as e:
+                    raise ValueError(
+                        "Invalid value for field '%s'. Reason: %s"
+                        % (field_name, str(e))
+                    )
 
             if non_existent_fields:
                 raise ValueError(
@@ -6392,7 +6464,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     % (non_existent_fields, self.name)
                 )
 
-            if self.media_type == fom.GROUP and not found_group:
+            if media_type == fom.GROUP and not found_group:
                 raise ValueError(
                     "Found sample missing group field '%s'" % self.group_field
                 )
@@ -6422,6 +6494,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc = doc
         self._sample_doc_cls = sample_doc_cls
         self._frame_doc_cls = frame_doc_cls
+        self._collection_cache.clear()
 
         if new_media_type:
             self._set_media_type(doc.media_type)
@@ -6447,10 +6520,71 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self.save()
 
 
+def _parse_sample_dict(
+    sd, media_type=None, rel_dir=None, frame_labels_dir=None
+):
+    if rel_dir and not os.path.isabs(sd["filepath"]):
+        sd["filepath"] = os.path.join(rel_dir, sd["filepath"])
+
+    if (media_type == fom.VIDEO) or (
+        media_type == fom.GROUP
+        and fom.get_media_type(sd["filepath"]) == fom.VIDEO
+    ):
+        frames = sd.pop("frames", {})
+
+        if etau.is_str(frames):
+            frames_path = os.path.join(frame_labels_dir, frames)
+            frames = fou.read_json(frames_path).get("frames", {})
+
+        sample = fos.Sample.from_dict(sd)
+
+        for key, value in frames.items():
+            sample.frames[int(key)] = fofr.Frame.from_dict(value)
+    else:
+        sample = fos.Sample.from_dict(sd)
+
+    return sample
+
+
+def _count_leading_sample_matches(pipeline):
+    num_matches = 0
+    for stage in pipeline:
+        if (
+            not isinstance(stage, dict)
+            or list(stage.keys()) != ["$match"]
+            or _references_frames(stage["$match"])
+        ):
+            break
+
+        num_matches += 1
+
+    return num_matches
+
+
+def _references_frames(obj):
+    # Conservatively detects any reference to the `frames` field, including
+    # implicit ones via `$$ROOT` or `$$CURRENT`
+    if isinstance(obj, dict):
+        return any(
+            _references_frames(k) or _references_frames(v)
+            for k, v in obj.items()
+        )
+
+    if isinstance(obj, (list, tuple)):
+        return any(_references_frames(v) for v in obj)
+
+    if etau.is_str(obj):
+        root = obj.lstrip("$").split(".", 1)[0]
+        return root in ("frames", "ROOT", "CURRENT")
+
+    return False
+
+
+_RANDOM_CHARS = string.ascii_lowercase + string.digits
+
+
 def _get_random_characters(n):
-    return "".join(
-        random.choice(string.ascii_lowercase + string.digits) for _ in range(n)
-    )
+    return "".join(random.choices(_RANDOM_CHARS, k=n))
 
 
 def _list_datasets(include_private=False, glob_patt=None):
@@ -6464,7 +6598,7 @@ def _list_datasets(include_private=False, glob_patt=None):
         query = {"sample_collection_name": {"$regex": "^samples\\."}}
 
     if glob_patt is not None:
-        query["name"] = {"$regex": fnmatch.translate(glob_patt)}
+        query["name"] = _get_glob_query(glob_patt)
 
     # We don't want an error here if `name == None`
     _sort = lambda l: sorted(l, key=lambda x: (x is None, x))
@@ -6472,6 +6606,16 @@ def _list_datasets(include_private=False, glob_patt=None):
     return _sort(conn.datasets.find(query).distinct("name"))
 
 
+def _get_glob_query(glob_patt):
+    # Literal names can be matched directly against the unique `name` index
+    if not any(c in glob_patt for c in "*?["):
+        return glob_patt
+
+    # MongoDB uses search semantics, so the pattern must be anchored. Anchored
+    # patterns also allow MongoDB to bound its scan of the `name` index
+    return {"$regex": "^" + fnmatch.translate(glob_patt)}
+
+
 def _list_dataset_info(include_private=False, glob_patt=None):
     info = []
     for name in _list_datasets(
@@ -6802,25 +6946,18 @@ def _clone_dataset_or_view(dataset_or_view, name, persistent):
         # Respect filtered sample fields, if any
         schema = view.get_field_schema()
         dataset_doc.sample_fields = [
-            f
-            for f in dataset_doc.sample_fields
-            if f.name in set(schema.keys())
+            f for f in dataset_doc.sample_fields if f.name in schema
         ]
 
         # Respect filtered frame fields, if any
         if contains_videos:
             frame_schema = view.get_frame_field_schema()
             dataset_doc.frame_fields = [
-                f
-                for f in dataset_doc.frame_fields
-                if f.name in set(frame_schema.keys())
+                f for f in dataset_doc.frame_fields if f.name in frame_schema
             ]
 
     dataset_doc.save(upsert=True)
 
-    # Create indexes
-    _create_indexes(sample_collection_name, frame_collection_name)
-
     # Clone samples
     coll, pipeline = _get_samples_pipeline(dataset_or_view)
     pipeline.append({"$addFields": {"_dataset_id": _id}})
@@ -6834,6 +6971,10 @@ def _clone_dataset_or_view(dataset_or_view, name, persistent):
         pipeline.append({"$out": frame_collection_name})
         foo.aggregate(coll, pipeline)
 
+    # Create indexes after the collections are populated, so that each index
+    # is built in a single pass rather than maintained during the `$out`
+    _create_indexes(sample_collection_name, frame_collection_name)
+
     clone_dataset = load_dataset(name)
 
     # Clone extras (full datasets only)
@@ -6927,8 +7068,18 @@ def _save_view(view, fields=None):
     save_samples = sample_fields or all_fields
     save_frames = contains_videos and (frame_fields or all_fields)
 
+    # IDs are only needed to reload in-memory samples/frames, which is often
+    # unnecessary
+    reload_samples = save_samples and fos.Sample._has_instances(
+        dataset._sample_collection_name
+    )
+    reload_frames = save_frames and fofr.Frame._has_instances(
+        dataset._frame_collection_name
+    )
+
     # Must retrieve IDs now in case view changes after saving
-    sample_ids = view.values("id")
+    if reload_samples or reload_frames:
+        sample_ids = view.values("id")
 
     #
     # Save samples
@@ -6938,7 +7089,7 @@ def _save_view(view, fields=None):
 
     if sample_fields:
         pipeline.append({"$project": {f: True for f in sample_fields}})
-        pipeline.append({"$merge": dataset._sample_collection_name})
+        pipeline.append(_make_partial_merge(dataset._sample_collection_name))
         foo.aggregate(dataset._sample_collection, pipeline)
     elif save_samples:
         pipeline.append(
@@ -6972,7 +7123,9 @@ def _save_view(view, fields=None):
 
         if frame_fields:
             pipeline.append({"$project": {f: True for f in frame_fields}})
-            pipeline.append({"$merge": dataset._frame_collection_name})
+            pipeline.append(
+                _make_partial_merge(dataset._frame_collection_name)
+            )
             foo.aggregate(dataset._sample_collection, pipeline)
         else:
             pipeline.append(
@@ -6989,17 +7142,35 @@ def _save_view(view, fields=None):
     # Reload in-memory documents
     #
 
-    if save_samples:
+    if reload_samples:
         fos.Sample._reload_docs(
             dataset._sample_collection_name, sample_ids=sample_ids
         )
 
-    if save_frames:
+    if reload_frames:
         fofr.Frame._reload_docs(
             dataset._frame_collection_name, sample_ids=sample_ids
         )
 
 
+def _make_partial_merge(collection_name):
+    # Documents that contain only a subset of fields must never be inserted,
+    # e.g., if their sample was deleted while the view was being saved
+    return {
+        "$merge": {
+            "into": collection_name,
+            "whenMatched": "merge",
+            "whenNotMatched": "discard",
+        }
+    }
+
+
+def _omit_fields(schema, omit_fields):
+    # Schemas are freshly built, so they can be modified in-place
+    for field_name in set(omit_fields):
+        schema.pop(field_name, None)
+
+
 def _merge_dataset_doc(
     dataset,
     collection_or_doc,
@@ -7099,13 +7270,9 @@ def _merge_dataset_doc(
             omit_fields, omit_frame_fields = fou.split_frame_fields(
                 omit_fields
             )
-            frame_schema = {
-                k: v
-                for k, v in frame_schema.items()
-                if k not in omit_frame_fields
-            }
+            _omit_fields(frame_schema, omit_frame_fields)
 
-        schema = {k: v for k, v in schema.items() if k not in omit_fields}
+        _omit_fields(schema, omit_fields)
 
     if fields is not None:
         if not isinstance(fields, dict):
@@ -7215,13 +7382,21 @@ def _clone_extras(src_dataset, dst_dataset):
 
 
 def _clone_view_doc(view_doc):
-    _view_doc = view_doc.copy()
+    _view_doc = _copy_doc(view_doc)
     _view_doc.id = ObjectId()
     return _view_doc
 
 
+def _copy_doc(doc):
+    # Round-tripping through BSON is much faster than `doc.copy()`, which
+    # recursively deep copies every field value
+    d = doc.to_mongo()
+    d.pop("_id", None)
+    return doc.__class__._from_son(d, created=True)
+
+
 def _clone_run(run_doc):
-    _run_doc = run_doc.copy()
+    _run_doc = _copy_doc(run_doc)
     _run_doc.id = ObjectId()
     _run_doc.results = None
 
@@ -7246,7 +7421,9 @@ def _ensure_index(dataset, db_field, unique=False):
     # db_field -> (name, unique)
     index_map = _get_single_index_map(coll)
 
-    new = False
+    # The name of the new index, if any, is returned so that cleanup doesn't
+    # need to look it up again
+    new = None
     dropped = False
 
     if db_field in index_map:
@@ -7259,8 +7436,7 @@ def _ensure_index(dataset, db_field, unique=False):
         coll.drop_index(name)
         dropped = True
 
-    coll.create_index(db_field, unique=True)
-    new = True
+    new = coll.create_index(db_field, unique=True)
 
     return new, dropped
 
@@ -7269,24 +7445,13 @@ def _cleanup_index(dataset, db_field, new_index, dropped_index):
     coll = dataset._sample_collection
 
     if new_index:
-        # db_field -> (name, unique)
-        index_map = _get_single_index_map(coll)
-
-        name = index_map[db_field][0]
-        if name in coll.index_information():
-            coll.drop_index(name)
+        if new_index in coll.index_information():
+            coll.drop_index(new_index)
 
     if dropped_index:
         coll.create_index(db_field)
 
 
-def _cleanup_frame_index(dataset, index):
-    coll = dataset._frame_collection
-
-    if index in coll.index_information():
-        coll.drop_index(index)
-
-
 def _get_single_index_map(coll):
     # db_field -> (name, unique)
     return {
@@ -7492,30 +7657,59 @@ def _make_merge_samples_generator(
                 f for f in insert_omit_fields if f != "filepath"
             ]
 
-    for sample in samples:
-        key = key_fcn(sample)
-        if key in id_map:
-            if not skip_existing:
-                existing_sample = dataset[id_map[key]]
-                existing_sample.merge(
-                    sample,
-                    fields=fields,
-                    omit_fields=omit_fields,
-                    merge_lists=merge_lists,
-                    overwrite=overwrite,
-                    expand_schema=expand_schema,
-                )
+    # Existing samples are loaded via one query per batch. Batches are sized
+    # dynamically, like in add_samples(), so that batches of large sample
+    # documents stay small
+    batcher = fou.DynamicBatcher(
+        samples, target_latency=0.2, init_batch_size=1, max_batch_beta=2.0
+    )
 
-                yield existing_sample
-        elif insert_new:
-            if insert_fields is not None or insert_omit_fields is not None:
-                sample = sample.copy(
-                    fields=insert_fields, omit_fields=insert_omit_fields
-                )
-            elif sample._in_db:
-                sample = sample.copy()
+    for batch in batcher:
+        keys = [key_fcn(sample) for sample in batch]
+
+        # Load all existing samples in the batch via a single query
+        if skip_existing:
+            existing_samples = {}
+        else:
+            existing_samples = _load_samples_by_id(
+                dataset, [id_map[key] for key in keys if key in id_map]
+            )
 
-            yield sample
+        for sample, key in zip(batch, keys):
+            if key in id_map:
+                if not skip_existing:
+                    existing_sample = existing_samples[id_map[key]]
+                    existing_sample.merge(
+                        sample,
+                        fields=fields,
+                        omit_fields=omit_fields,
+                        merge_lists=merge_lists,
+                        overwrite=overwrite,
+                        expand_schema=expand_schema,
+                    )
+
+                    yield existing_sample
+            elif insert_new:
+                if insert_fields is not None or insert_omit_fields is not None:
+                    sample = sample.copy(
+                        fields=insert_fields, omit_fields=insert_omit_fields
+                    )
+                elif sample._in_db:
+                    sample = sample.copy()
+
+                yield sample
+
+
+def _load_samples_by_id(dataset, ids):
+    if not ids:
+        return {}
+
+    samples = {}
+    for d in dataset._sample_collection.find({"_id": {"$in": ids}}):
+        doc = dataset._sample_dict_to_doc(d)
+        samples[d["_id"]] = fos.Sample.from_doc(doc, dataset=dataset)
+
+    return samples
 
 
 def _merge_samples_pipeline(
@@ -7548,13 +7742,11 @@ def _merge_samples_pipeline(
         else:
             src_videos = src_collection
 
-        if dst_dataset.media_type == fom.GROUP:
-            dst_videos = dst_dataset.select_group_slices(media_type=fom.VIDEO)
-        else:
-            dst_videos = dst_dataset
-
     src_dataset = src_collection._dataset
 
+    # Frames only need to be merged if the source actually has some
+    merge_frames = contains_videos and _has_frames(src_videos)
+
     if contains_videos:
         frame_fields = None
         omit_frame_fields = None
@@ -7645,13 +7837,11 @@ def _merge_samples_pipeline(
         if insert_new:
             if fields is not None:
                 delete_fields.update(
-                    f for f in default_fields if f not in set(fields.values())
+                    default_fields.difference(fields.values())
                 )
 
             if omit_fields is not None:
-                delete_fields.update(
-                    f for f in default_fields if f in omit_fields
-                )
+                delete_fields.update(default_fields.intersection(omit_fields))
 
         when_matched = _merge_docs(
             src_collection,
@@ -7685,39 +7875,40 @@ def _merge_samples_pipeline(
     #
     # Prepare frames merge pipeline
     #
-    # The implementation of merging video frames is currently a bit complex.
-    # It may be possible to simplify this...
-    #
-    # The trouble is that the `_sample_id` of the frame documents need to match
-    # the `_id` of the sample documents after merging. There may be a more
-    # clever way to make this happen via `$lookup` than what is implemented
-    # here, but here's the current workflow:
+    # The `_sample_id` of the frame documents need to match the `_id` of the
+    # sample documents after merging, which is resolved inline as follows:
     #
-    # - Store the `key_field` value on each frame document in both the source
-    #   and destination collections corresopnding to its parent sample in a
-    #   temporary `frame_key_field` field
     # - Merge the sample documents without frames attached
-    # - Merge the frame documents on `[frame_key_field, frame_number]` with
-    #   their old `_sample_id`s unset
-    # - Generate a `key_field` -> `_id` mapping for the post-merge sample docs,
-    #   then make a pass over the frame documents and set
-    #   their `_sample_id` to the corresponding value from this mapping
-    # - The merge is complete, so delete `frame_key_field` from both frame
-    #   collections
+    # - Unwind the source frames while carrying the `key_field` value of their
+    #   parent sample in a temporary `frame_key_field` field
+    # - `$lookup` the post-merge `_id` of the destination sample with this
+    #   `key_field` value and store it as the frame's `_sample_id`
+    # - Merge the frame documents on `[_sample_id, frame_number]`
+    #
+    # The frames must be unwound immediately after they are attached so that
+    # MongoDB coalesces the `$lookup` and `$unwind` stages. Otherwise, all
+    # frames of a video are collected into a single document, which can
+    # exceed the 16MB BSON limit
     #
 
-    if contains_videos:
+    if merge_frames:
         frame_key_field = "_merge_key"
 
-        # @todo this there a cleaner way to avoid this? we have to be sure that
-        # `frame_key_field` is not excluded by a user's view here...
-        _src_videos = _always_select_field(
-            src_videos, "frames." + frame_key_field
-        )
-
         db_fields_map = src_collection._get_db_fields_map(frames=True)
 
-        frame_pipeline = []
+        frame_pipeline = [
+            {"$unwind": "$frames"},
+            {
+                "$replaceRoot": {
+                    "newRoot": {
+                        "$mergeObjects": [
+                            "$frames",
+                            {frame_key_field: "$" + key_field},
+                        ]
+                    }
+                }
+            },
+        ]
 
         if frame_fields is not None:
             project = {}
@@ -7759,16 +7950,37 @@ def _merge_samples_pipeline(
 
         frame_pipeline.extend(
             [
+                {
+                    "$lookup": {
+                        "from": dst_dataset._sample_collection_name,
+                        "let": {"key": "$" + frame_key_field},
+                        "pipeline": [
+                            {
+                                "$match": {
+                                    "$expr": {
+                                        "$eq": ["$" + key_field, "$$key"]
+                                    }
+                                }
+                            },
+                            {"$project": {"_id": True}},
+                        ],
+                        "as": frame_key_field,
+                    }
+                },
+                # When `insert_new=False`, source samples that were not merged
+                # have no destination sample, so their frames are discarded
+                {"$unwind": "$" + frame_key_field},
                 {
                     "$addFields": {
                         "_dataset_id": dst_dataset._doc.id,
-                        "_sample_id": "$" + frame_key_field,
+                        "_sample_id": "$" + frame_key_field + "._id",
                     }
                 },
+                {"$project": {frame_key_field: False}},
                 {
                     "$merge": {
                         "into": dst_dataset._frame_collection_name,
-                        "on": [frame_key_field, "frame_number"],
+                        "on": ["_sample_id", "frame_number"],
                         "whenMatched": when_frame_matched,
                         "whenNotMatched": "insert",
                     }
@@ -7780,16 +7992,14 @@ def _merge_samples_pipeline(
     # Perform the merge(s)
     #
     # We wrap this in a try-finally because we need to ensure that temporary
-    # data and collection indexes are deleted if something goes wrong during
-    # the actual merges
+    # collection indexes are deleted if something goes wrong during the actual
+    # merges
     #
 
     new_src_index = None
     dropped_src_index = None
     new_dst_index = None
     dropped_dst_index = None
-    dst_frame_index = None
-    src_frame_index = None
 
     try:
         # Create unique index on merge key, if necessary
@@ -7800,19 +8010,6 @@ def _merge_samples_pipeline(
             dst_dataset, key_field, unique=True
         )
 
-        if contains_videos:
-            _index_frames(dst_dataset, key_field, frame_key_field)
-            _index_frames(src_dataset, key_field, frame_key_field)
-
-            # Create unique index on frame merge key
-            frame_index_spec = [(frame_key_field, 1), ("frame_number", 1)]
-            dst_frame_index = dst_dataset._frame_collection.create_index(
-                frame_index_spec, unique=True
-            )
-            src_frame_index = src_dataset._frame_collection.create_index(
-                frame_index_spec, unique=True
-            )
-
         # Merge samples
         src_samples._aggregate(
             detach_frames=True,
@@ -7820,14 +8017,11 @@ def _merge_samples_pipeline(
             post_pipeline=sample_pipeline,
         )
 
-        if contains_videos:
+        if merge_frames:
             # Merge frames
-            _src_videos._aggregate(
-                frames_only=True, post_pipeline=frame_pipeline
+            src_videos._aggregate(
+                attach_frames=True, post_pipeline=frame_pipeline
             )
-
-            # Finalize IDs
-            _finalize_frames(dst_videos, key_field, frame_key_field)
     finally:
         # Cleanup indexes
         _cleanup_index(
@@ -7837,22 +8031,28 @@ def _merge_samples_pipeline(
             dst_dataset, key_field, new_dst_index, dropped_dst_index
         )
 
-        if contains_videos:
-            # Cleanup indexes
-            _cleanup_frame_index(dst_dataset, dst_frame_index)
-            _cleanup_frame_index(src_dataset, src_frame_index)
-
-            # Cleanup merge key
-            cleanup_op = {"$unset": {frame_key_field: ""}}
-            src_dataset._frame_collection.update_many({}, cleanup_op)
-            dst_dataset._frame_collection.update_many({}, cleanup_op)
-
     # Reload docs
     fos.Sample._reload_docs(dst_dataset._sample_collection_name)
-    if contains_videos:
+    if merge_frames:
         fofr.Frame._reload_docs(dst_dataset._frame_collection_name)
 
 
+def _has_frames(sample_collection):
+    # Checking the frame collection is cheap, so do that first
+    frame_coll = sample_collection._dataset._frame_collection
+    if frame_coll.find_one({}, {"_id": True}) is None:
+        return False
+
+    if not isinstance(sample_collection, fov.DatasetView):
+        return True
+
+    results = sample_collection._aggregate(
+        frames_only=True,
+        post_pipeline=[{"$limit": 1}, {"$project": {"_id": True}}],
+    )
+    return bool(list(results))
+
+
 def _merge_docs(
     sample_collection,
     merge_lists=True,
@@ -7891,6 +8091,9 @@ def _merge_docs(
         list_fields = None
         elem_fields = None
 
+    if delete_fields:
+        delete_fields = sorted(delete_fields)
+
     if overwrite:
         root_doc = "$$ROOT"
 
@@ -7898,7 +8101,7 @@ def _merge_docs(
             cond = {
                 "$and": [
                     {"$ne": ["$$item.v", None]},
-                    {"$not": {"$in": ["$$item.k", list(delete_fields)]}},
+                    {"$not": {"$in": ["$$item.k", delete_fields]}},
                 ]
             }
         else:
@@ -7922,9 +8125,7 @@ def _merge_docs(
                     "$filter": {
                         "input": {"$objectToArray": "$$new"},
                         "as": "item",
-                        "cond": {
-                            "$not": {"$in": ["$$item.k", list(delete_fields)]}
-                        },
+                        "cond": {"$not": {"$in": ["$$item.k", delete_fields]}},
                     }
                 }
             }
@@ -7993,78 +8194,59 @@ def _merge_list_field(doc, list_field):
 def _merge_label_list_field(doc, elem_field, overwrite=False):
     field, leaf = elem_field.split(".")
 
+    # Each element is checked against only the IDs common to both lists.
+    # `$in` is still a linear scan, so this is O(n * c) in the overlap `c`
+    # and heavily overlapping lists cost the same as before
+    common_ids = {
+        "$setIntersection": [
+            {"$map": {"input": "$" + elem_field, "in": "$$this._id"}},
+            {"$map": {"input": "$$new." + elem_field, "in": "$$this._id"}},
+        ]
+    }
+
     if overwrite:
         root = "$$new." + field
         elements = {
-            "$reverseArray": {
-                "$let": {
-                    "vars": {
-                        "new_ids": {
-                            "$map": {
-                                "input": "$$new." + elem_field,
+            "$let": {
+                "vars": {"common_ids": common_ids},
+                "in": {
+                    "$concatArrays": [
+                        {
+                            "$filter": {
+                                "input": "$" + elem_field,
                                 "as": "this",
-                                "in": "$$this._id",
-                            },
+                                "cond": {
+                                    "$not": {
+                                        "$in": ["$$this._id", "$$common_ids"]
+                                    }
+                                },
+                            }
                         },
-                    },
-                    "in": {
-                        "$reduce": {
-                            "input": {"$reverseArray": "$" + elem_field},
-                            "initialValue": {
-                                "$reverseArray": "$$new." + elem_field
-                            },
-                            "in": {
-                                "$cond": {
-                                    "if": {
-                                        "$not": {
-                                            "$in": ["$$this._id", "$$new_ids"]
-                                        }
-                                    },
-                                    "then": {
-                                        "$concatArrays": [
-                                            "$$value",
-                                            ["$$this"],
-                                        ]
-                                    },
-                                    "else": "$$value",
-                                }
-                            },
-                        }
-                    },
-                }
+                        "$$new." + elem_field,
+                    ]
+                },
             }
         }
     else:
         root = "$" + field
         elements = {
             "$let": {
-                "vars": {
-                    "existing_ids": {
-                        "$map": {
-                            "input": "$" + elem_field,
-                            "as": "this",
-                            "in": "$$this._id",
-                        },
-                    },
-                },
+                "vars": {"common_ids": common_ids},
                 "in": {
-                    "$reduce": {
-                        "input": "$$new." + elem_field,
-                        "initialValue": "$" + elem_field,
-                        "in": {
-                            "$cond": {
-                                "if": {
+                    "$concatArrays": [
+                        "$" + elem_field,
+                        {
+                            "$filter": {
+                                "input": "$$new." + elem_field,
+                                "as": "this",
+                                "cond": {
                                     "$not": {
-                                        "$in": ["$$this._id", "$$existing_ids"]
+                                        "$in": ["$$this._id", "$$common_ids"]
                                     }
                                 },
-                                "then": {
-                                    "$concatArrays": ["$$value", ["$$this"]]
-                                },
-                                "else": "$$value",
                             }
                         },
-                    }
+                    ]
                 },
             }
         }
@@ -8086,34 +8268,6 @@ def _merge_label_list_field(doc, elem_field, overwrite=False):
     }
 
 
-def _index_frames(dataset, key_field, frame_key_field):
-    if dataset.media_type == fom.GROUP:
-        dst_videos = dataset.select_group_slices(media_type=fom.VIDEO)
-    else:
-        dst_videos = dataset
-
-    ids, keys, all_sample_ids = dst_videos.values(
-        ["_id", key_field, "frames._sample_id"]
-    )
-    keys_map = {k: v for k, v in zip(ids, keys)}
-
-    frame_keys = []
-    for sample_ids in all_sample_ids:
-        if sample_ids:
-            sample_keys = [keys_map[_id] for _id in sample_ids]
-        else:
-            sample_keys = sample_ids
-
-        frame_keys.append(sample_keys)
-
-    dst_videos.set_values(
-        "frames." + frame_key_field,
-        frame_keys,
-        expand_schema=False,
-        _allow_missing=True,
-    )
-
-
 def _always_select_field(sample_collection, field):
     if not isinstance(sample_collection, fov.DatasetView):
         return sample_collection
@@ -8136,22 +8290,6 @@ def _always_select_field(sample_collection, field):
     return _view
 
 
-def _finalize_frames(sample_collection, key_field, frame_key_field):
-    results = sample_collection.values([key_field, "_id"])
-    ids_map = {k: v for k, v in zip(*results)}
-
-    frame_coll = sample_collection._dataset._frame_collection
-
-    ops = [
-        UpdateMany(
-            {frame_key_field: key}, {"$set": {"_sample_id": ids_map[key]}}
-        )
-        for key in frame_coll.distinct(frame_key_field)
-    ]
-
-    foo.bulk_write(ops, frame_coll)
-
-
 def _get_media_type(sample):
     for field, value in sample.iter_fields():
         if isinstance(value, fog.Group):
@@ -8160,6 +8298,74 @@ def _get_media_type(sample):
     return sample.media_type
 
 
+def _get_implied_values(doc, schema=None):
+    values = {}
+    for field_name in doc._get_field_names(include_private=True):
+        if field_name == "_id":
+            continue
+
+        if schema is not None and field_name in schema:
+            continue
+
+        value = doc[field_name]
+
+        if value is None:
+            continue
+
+        values[field_name] = value
+
+        if schema is not None:
+            schema.add(field_name)
+
+    return values
+
+
+def _merge_implied_fields(doc_cls, new_fields, dynamic):
+    if not new_fields:
+        return False
+
+    schema = {
+        path: foo.create_implied_field(path, value, dynamic=dynamic)
+        for path, value in new_fields.items()
+    }
+
+    return doc_cls.merge_field_schema(schema, validate=False)
+
+
+def _make_validators(schema):
+    return {
+        field_name: (field.validate, field.null, _get_trusted_type(field))
+        for field_name, field in schema.items()
+    }
+
+
+def _get_trusted_type(field):
+    # Returns a type whose instances are always valid values for the field, so
+    # that validation of the most common primitive values can be skipped
+    field_type = type(field)
+
+    if field_type is fof.BooleanField:
+        return bool
+
+    if field_type is fof.IntField or field_type is fof.FloatField:
+        if field.min_value is not None or field.max_value is not None:
+            return None
+
+        return int if field_type is fof.IntField else float
+
+    if field_type is fof.StringField:
+        if (
+            field.min_length is not None
+            or field.max_length is not None
+            or field.regex is not None
+        ):
+            return None
+
+        return str
+
+    return None
+
+
 def _get_group_field(schema):
     for field_name, field in schema.items():
         if isinstance(field, fof.EmbeddedDocumentField) and issubclass(
@@ -8273,9 +8479,14 @@ def _to_list(arg):
 
 
 def _parse_fields(field_names):
-    field_names = _to_list(field_names)
-    fields = [f for f in field_names if "." not in f]
-    embedded_fields = [f for f in field_names if "." in f]
+    fields = []
+    embedded_fields = []
+    for field_name in _to_list(field_names):
+        if "." in field_name:
+            embedded_fields.append(field_name)
+        else:
+            fields.append(field_name)
+
     return fields, embedded_fields
 
 
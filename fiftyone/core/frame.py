@@ -427,11 +427,17 @@ class Frames(object):
             dynamic (False): whether to declare dynamic embedded document
                 fields
         """
-        for frame_number, frame in frames.items():
+        items = list(frames.items())
+
+        # Load all existing frames that will be merged via a single query
+        frame_numbers = self._get_frame_numbers()
+        self._load_frames(fn for fn, _ in items if fn in frame_numbers)
+
+        for frame_number, frame in items:
             if isinstance(frame, dict):
                 frame = Frame(frame_number=frame_number, **frame)
 
-            if frame_number in self:
+            if frame_number in frame_numbers:
                 self[frame_number].merge(
                     frame,
                     fields=fields,
@@ -514,6 +520,31 @@ class Frames(object):
             {"_sample_id": self._sample_id, "frame_number": frame_number}
         )
 
+    def _get_frames_db(self, frame_numbers):
+        return self._frame_collection.find(
+            {
+                "_sample_id": self._sample_id,
+                "frame_number": {"$in": frame_numbers},
+            }
+        )
+
+    def _load_frames(self, frame_numbers):
+        if not self._in_db or self._delete_all:
+            return
+
+        frame_numbers = [
+            fn
+            for fn in frame_numbers
+            if fn not in self._replacements and fn not in self._delete_frames
+        ]
+
+        if not frame_numbers:
+            return
+
+        for d in self._get_frames_db(frame_numbers):
+            frame = self._make_frame(d)
+            self._set_replacement(frame)
+
     def _get_frames_match_stage(self):
         if self._dataset._is_clips:
             first, last = self._sample.support
@@ -754,6 +785,29 @@ class Frames(object):
 
         return ops
 
+    def _insert_replacements(self, validate=True):
+        # Optimized alternative to `_save_replacements()` for samples that
+        # were just added to a dataset. All of their frames are new, so we can
+        # generate frame IDs locally and return `(frame, dict)` pairs that the
+        # caller can insert in batches across samples via
+        # `Dataset._insert_frames()`, rather than upserting and then querying
+        # the database for the new IDs
+        if not self._replacements:
+            return []
+
+        if validate:
+            self._validate_frames(self._replacements)
+
+        inserts = []
+        for frame in self._replacements.values():
+            d = self._make_dict(frame)
+            d["_id"] = ObjectId()
+            inserts.append((frame, d))
+
+        self._replacements.clear()
+
+        return inserts
+
     def _validate_frames(self, frames):
         schema = self._dataset.get_frame_field_schema(include_private=True)
 
@@ -948,6 +1002,22 @@ class FramesView(Frames):
         except StopIteration:
             return None
 
+    def _get_frames_db(self, frame_numbers):
+        if not self._needs_frames:
+            return super()._get_frames_db(frame_numbers)
+
+        return self._view._aggregate(
+            frames_only=True,
+            post_pipeline=[
+                {
+                    "$match": {
+                        "_sample_id": self._sample_id,
+                        "frame_number": {"$in": frame_numbers},
+                    }
+                }
+            ],
+        )
+
     def _iter_frames_db(self):
         if not self._needs_frames:
             return super()._iter_frames_db()
@@ -105,13 +105,24 @@ class SampleFieldDocument(EmbeddedDocument):
         Returns:
             a :class:`SampleFieldDocument`
         """
-        embedded_doc_type = cls._get_attr_repr(field, "document_type")
+        field_doc = cls._from_field(field)
+        field_doc.validate()
+        return field_doc
+
+    @classmethod
+    def _from_field(cls, field):
         if isinstance(field, (ListField, DictField)) and field.field:
             embedded_doc_type = cls._get_attr_repr(
                 field.field, "document_type"
             )
+        else:
+            embedded_doc_type = cls._get_attr_repr(field, "document_type")
 
-        return cls(
+        # Bypass the validation in `EmbeddedDocument.__init__()`, since
+        # nested field documents are validated once by the top-level document
+        # in `from_field()`
+        field_doc = cls.__new__(cls)
+        super(EmbeddedDocument, field_doc).__init__(
             name=field.name,
             ftype=etau.get_class_name(field),
             embedded_doc_type=embedded_doc_type,
@@ -122,6 +133,8 @@ class SampleFieldDocument(EmbeddedDocument):
             info=field.info,
         )
 
+        return field_doc
+
     @staticmethod
     def _get_attr_repr(field, attr_name):
         attr = getattr(field, attr_name, None)
@@ -136,7 +149,7 @@ class SampleFieldDocument(EmbeddedDocument):
             return None
 
         return [
-            cls.from_field(value)
+            cls._from_field(value)
             for value in field.get_field_schema().values()
         ]
 
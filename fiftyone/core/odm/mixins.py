@@ -181,12 +181,13 @@ class DatasetMixin(object):
             ftype=ftype, embedded_doc_type=embedded_doc_type
         )
 
-        schema = OrderedDict()
-        field_names = cls._get_fields_ordered(include_private=include_private)
-        for field_name in field_names:
-            # pylint: disable=no-member
-            field = cls._fields[field_name]
+        fields = cls._get_field_schema_cached(include_private)
+
+        if ftype is None and embedded_doc_type is None:
+            return OrderedDict(fields)
 
+        schema = OrderedDict()
+        for field_name, field in fields:
             if fof.matches_type_constraints(
                 field, ftype=ftype, embedded_doc_type=embedded_doc_type
             ):
@@ -194,6 +195,38 @@ class DatasetMixin(object):
 
         return schema
 
+    @classmethod
+    def _get_field_schema_cached(cls, include_private):
+        # Cached entries are invalidated whenever the ordered field names are
+        # reassigned or a field is (re)declared on this class
+        fields_ordered = cls._fields_ordered
+        version = cls.__dict__.get("_schema_version", 0)
+
+        cache = cls.__dict__.get("_schema_cache", None)
+        if cache is None:
+            cache = {}
+            cls._schema_cache = cache
+
+        entry = cache.get(include_private, None)
+        if (
+            entry is not None
+            and entry[0] is fields_ordered
+            and entry[1] == version
+        ):
+            return entry[2]
+
+        field_names = cls._get_fields_ordered(include_private=include_private)
+
+        # pylint: disable=no-member
+        fields = tuple((fn, cls._fields[fn]) for fn in field_names)
+        cache[include_private] = (fields_ordered, version, fields)
+
+        return fields
+
+    @classmethod
+    def _bump_schema_version(cls):
+        cls._schema_version = cls.__dict__.get("_schema_version", 0) + 1
+
     @classmethod
     def merge_field_schema(
         cls,
@@ -1208,6 +1241,7 @@ class DatasetMixin(object):
         cls._fields[field_name] = field
 
         setattr(cls, field_name, field)
+        cls._bump_schema_version()
 
     @classmethod
     def _update_field(cls, dataset, field_name, new_path, field):
@@ -1230,6 +1264,7 @@ class DatasetMixin(object):
         field._set_dataset(dataset, new_path)
         cls._fields[new_field_name] = field
         setattr(cls, new_field_name, field)
+        cls._bump_schema_version()
 
     @classmethod
     def _undeclare_field(cls, field_name):
@@ -1244,6 +1279,7 @@ class DatasetMixin(object):
         )
 
         delattr(cls, field_name)
+        cls._bump_schema_version()
 
     def _update(
         self,
@@ -54,13 +54,22 @@ class _SampleMixin(object):
         super().__setattr__(name, value)
 
     def __getitem__(self, field_name):
-        if self.media_type == fomm.VIDEO and fofu.is_frame_number(field_name):
+        # Field names are checked first since `media_type` is a field lookup
+        if (
+            not isinstance(field_name, str)
+            and self.media_type == fomm.VIDEO
+            and fofu.is_frame_number(field_name)
+        ):
             return self.frames[field_name]
 
         return super().__getitem__(field_name)
 
     def __setitem__(self, field_name, value):
-        if self.media_type == fomm.VIDEO and fofu.is_frame_number(field_name):
+        if (
+            not isinstance(field_name, str)
+            and self.media_type == fomm.VIDEO
+            and fofu.is_frame_number(field_name)
+        ):
             self.frames[field_name] = value
             return
 
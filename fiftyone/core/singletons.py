@@ -113,6 +113,10 @@ class SampleSingleton(DocumentSingleton):
         # pylint: disable=no-value-for-parameter
         cls._reload_doc(obj._doc.collection_name, obj.id)
 
+    def _has_instances(cls, collection_name):
+        """Checks whether any in-memory samples exist in the collection."""
+        return bool(cls._instances.get(collection_name, None))
+
     def _rename_fields(cls, collection_name, field_names, new_field_names):
         """Renames the field on all in-memory samples in the collection."""
         if collection_name not in cls._instances:
@@ -260,6 +264,11 @@ class FrameSingleton(DocumentSingleton):
             obj._doc.collection_name, obj.sample_id, obj.frame_number
         )
 
+    def _has_instances(cls, collection_name):
+        """Checks whether any in-memory frames exist in the collection."""
+        samples = cls._instances.get(collection_name, {})
+        return any(bool(frames) for frames in samples.values())
+
     def _get_instances(cls, collection_name, sample_id):
         """Returns a frame number -> Frame dict containing all in-memory frame
         instances for the specified sample.
@@ -62,7 +62,13 @@ import numpy as np
 import pytz
 import xmltodict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import eta
+import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone as fo
@@ -833,6 +839,64 @@ def load_xml_as_json_dict(xml_path):
         raise ExpatError(f"Failed to read {xml_path}: {ex}")
 
 
+def read_json(json_path):
+    """Reads a JSON file from disk.
+
+    If ``orjson`` is installed, it is used to parse the file, which is
+    significantly faster than the builtin ``json`` module for large files.
+    Otherwise, :func:`eta.core.serial.read_json` is used.
+
+    Args:
+        json_path: the path to the JSON file
+
+    Returns:
+        the parsed JSON contents
+    """
+    if orjson is not None:
+        with open(json_path, "rb") as f:
+            b = f.read()
+
+        try:
+            return orjson.loads(b)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than `json`, which accepts non-standard
+            # values like `NaN`
+            pass
+
+    return etas.read_json(json_path)
+
+
+def write_json(obj, json_path):
+    """Writes a JSON object to disk.
+
+    If ``orjson`` is installed, it is used to serialize the object, which is
+    significantly faster than the builtin ``json`` module for large objects.
+    Otherwise, or if the object contains values that ``orjson`` cannot
+    serialize in the same way, :func:`eta.core.serial.write_json` is used.
+
+    Args:
+        obj: a JSON-serializable object
+        json_path: the path to write the JSON file
+    """
+    if orjson is not None:
+        try:
+            b = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            b = None
+
+        # orjson writes non-finite floats like `NaN` as `null`, while `json`
+        # writes them as `NaN`. So that the output does not depend on whether
+        # orjson is installed, we don't use it if the output contains `null`
+        if b is not None and b"null" not in b:
+            etau.ensure_basedir(json_path)
+            with open(json_path, "wb") as f:
+                f.write(b)
+
+            return
+
+    etas.write_json(obj, json_path)
+
+
 def parse_serializable(obj, cls):
     """Parses the given object as an instance of the given
     ``eta.core.serial.Serializable`` class.
@@ -9,7 +9,6 @@ Utilities for working with datasets in
 from collections import defaultdict
 import csv
 from datetime import datetime
-from itertools import groupby
 import logging
 import multiprocessing
 import multiprocessing.dummy
@@ -22,7 +21,6 @@ import numpy as np
 from skimage import measure
 
 import eta.core.image as etai
-import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.web as etaw
 
@@ -62,6 +60,10 @@ def add_coco_labels(
     -   the path to a JSON file whose ``"annotations"`` key contains a list of
         COCO annotations
 
+    When a JSON file is provided whose ``"images"`` key contains the
+    ``width`` and ``height`` of every annotated image, those dimensions are
+    used rather than computing metadata for the samples.
+
     When ``label_type="detections"``, the labels should have format::
 
         [
@@ -156,48 +158,77 @@ def add_coco_labels(
         tolerance (None): a tolerance, in pixels, when generating approximate
             polylines for instance masks. Typical values are 1-3 pixels
     """
+    image_dims = None
     if etau.is_str(labels_or_path):
-        labels = etas.load_json(labels_or_path)
+        labels = fou.read_json(labels_or_path)
         if isinstance(labels, dict):
+            image_dims = {
+                i.get("id", None): (
+                    i.get("width", None),
+                    i.get("height", None),
+                )
+                for i in labels.get("images", [])
+            }
             labels = labels["annotations"]
     else:
         labels = labels_or_path
 
-    coco_objects_map = defaultdict(list)
+    # Group raw annotations by image; `COCOObject`s are only constructed for
+    # images that are actually loaded
+    annos_map = defaultdict(list)
     for d in labels:
-        coco_obj = COCOObject.from_anno_dict(d, extra_attrs=extra_attrs)
-        coco_objects_map[coco_obj.image_id].append(coco_obj)
+        annos_map[d.get("image_id", None)].append(d)
 
     if coco_id_field is not None:
         # Use `coco_id_field` as key to match predictions with samples
         _coco_ids, _ids = sample_collection.values([coco_id_field, "id"])
-        id_map = {k: v for k, v in zip(_coco_ids, _ids)}
+        id_map = dict(zip(_coco_ids, _ids))
 
-        coco_ids = sorted(coco_objects_map.keys())
-        bad_ids = set(coco_ids) - set(id_map.keys())
+        coco_ids = sorted(annos_map.keys())
+        bad_ids = [_id for _id in coco_ids if _id not in id_map]
         if bad_ids:
-            coco_ids = [_id for _id in coco_ids if _id not in bad_ids]
+            coco_ids = [_id for _id in coco_ids if _id in id_map]
             logger.warning(
                 "Ignoring %d labels with nonexistent COCO IDs (eg %s)",
                 len(bad_ids),
-                next(iter(bad_ids)),
+                bad_ids[0],
             )
 
         sample_ids = [id_map[coco_id] for coco_id in coco_ids]
         view = sample_collection.select(sample_ids, ordered=True)
-        coco_objects = [coco_objects_map[coco_id] for coco_id in coco_ids]
     else:
         # Assume `image_id` is 1-based sample position
         view = sample_collection
-        coco_objects = [coco_objects_map[i] for i in range(1, len(view) + 1)]
+        coco_ids = range(1, len(view) + 1)
 
-    view.compute_metadata()
-    widths, heights = view.values(["metadata.width", "metadata.height"])
+    coco_objects = [
+        [
+            COCOObject.from_anno_dict(d, extra_attrs=extra_attrs)
+            for d in annos_map.get(coco_id, [])
+        ]
+        for coco_id in coco_ids
+    ]
 
-    labels = []
-    for _coco_objects, width, height in zip(coco_objects, widths, heights):
-        frame_size = (width, height)
+    frame_sizes = None
+    if image_dims:
+        # Frame sizes are only needed for images that have annotations
+        frame_sizes = [
+            image_dims.get(coco_id, (None, None)) for coco_id in coco_ids
+        ]
+        if any(
+            None in frame_size
+            for frame_size, _coco_objects in zip(frame_sizes, coco_objects)
+            if _coco_objects
+        ):
+            frame_sizes = None
+
+    if frame_sizes is None:
+        view.compute_metadata()
+        widths, heights = view.values(["metadata.width", "metadata.height"])
+        frame_sizes = zip(widths, heights)
 
+    labels = []
+    for _coco_objects, frame_size in zip(coco_objects, frame_sizes):
         if label_type == "detections":
             _labels = _coco_objects_to_detections(
                 _coco_objects,
@@ -242,7 +273,18 @@ def add_coco_labels(
 
         labels.append(_labels)
 
-    view.set_values(label_field, labels)
+    if label_type == "keypoints":
+        label_cls = fol.Keypoints
+    elif label_type == "segmentations" and use_polylines:
+        label_cls = fol.Polylines
+    else:
+        label_cls = fol.Detections
+
+    if view.has_field(label_field):
+        view.validate_field_type(label_field, embedded_doc_type=label_cls)
+
+    # The labels were already validated when they were constructed
+    view.set_values(label_field, labels, validate=False)
 
 
 class COCODetectionDatasetImporter(
@@ -545,6 +587,11 @@ class COCODetectionDatasetImporter(
     def setup(self):
         image_paths_map = self._load_data_map(self.data_path, recursive=True)
 
+        # Objects are only needed to load labels or to filter by class
+        load_objects = self.classes is not None or any(
+            t in self._label_types for t in _SUPPORTED_LABEL_TYPES
+        )
+
         if self.labels_path is not None and os.path.isfile(self.labels_path):
             (
                 info,
@@ -553,7 +600,9 @@ class COCODetectionDatasetImporter(
                 images,
                 annotations,
             ) = load_coco_detection_annotations(
-                self.labels_path, extra_attrs=self.extra_attrs
+                self.labels_path,
+                extra_attrs=self.extra_attrs,
+                load_objects=load_objects,
             )
 
             if classes is not None:
@@ -570,16 +619,13 @@ class COCODetectionDatasetImporter(
                 max_samples=self.max_samples,
             )
 
-            filenames = [
-                fou.normpath(images[_id]["file_name"]) for _id in image_ids
-            ]
-
-            _image_ids = set(image_ids)
-            image_dicts_map = {
-                fou.normpath(i["file_name"]): i
-                for _id, i in images.items()
-                if _id in _image_ids
-            }
+            filenames = []
+            image_dicts_map = {}
+            for _id in image_ids:
+                image_dict = images[_id]
+                filename = fou.normpath(image_dict["file_name"])
+                filenames.append(filename)
+                image_dicts_map[filename] = image_dict
         else:
             info = {}
             classes = None
@@ -908,7 +954,7 @@ class COCODetectionDatasetExporter(
         if self._has_labels:
             labels["annotations"] = self._annotations
 
-        etas.write_json(labels, self.labels_path)
+        fou.write_json(labels, self.labels_path)
 
         self._media_exporter.close()
 
@@ -936,6 +982,19 @@ class COCOObject(object):
         **attributes: additional custom attributes
     """
 
+    __slots__ = (
+        "id",
+        "image_id",
+        "category_id",
+        "bbox",
+        "segmentation",
+        "keypoints",
+        "score",
+        "area",
+        "iscrowd",
+        "attributes",
+    )
+
     def __init__(
         self,
         id=None,
@@ -1040,7 +1099,8 @@ class COCOObject(object):
         width, height = frame_size
 
         points = []
-        for x, y, v in fou.iter_batches(self.keypoints, 3):
+        _keypoints = iter(self.keypoints)
+        for x, y, v in zip(_keypoints, _keypoints, _keypoints):
             if v == 0:
                 points.append((float("nan"), float("nan")))
             else:
@@ -1328,7 +1388,9 @@ class COCOObject(object):
         return label, attributes
 
 
-def load_coco_detection_annotations(json_path, extra_attrs=True):
+def load_coco_detection_annotations(
+    json_path, extra_attrs=True, load_objects=True
+):
     """Loads the COCO annotations from the given JSON file.
 
     See :ref:`this page <COCODetectionDataset-import>` for format details.
@@ -1341,6 +1403,8 @@ def load_coco_detection_annotations(json_path, extra_attrs=True):
             -   ``True``: load all extra attributes found
             -   ``False``: do not load extra attributes
             -   a name or list of names of specific attributes to load
+        load_objects (True): whether to parse the object annotations. If
+            False, ``annotations`` is always ``None``
 
     Returns:
         a tuple of
@@ -1352,11 +1416,13 @@ def load_coco_detection_annotations(json_path, extra_attrs=True):
         -   annotations: a dict mapping image IDs to list of
             :class:`COCOObject` instances, or ``None`` for unlabeled datasets
     """
-    d = etas.load_json(json_path)
-    return _parse_coco_detection_annotations(d, extra_attrs=extra_attrs)
+    d = fou.read_json(json_path)
+    return _parse_coco_detection_annotations(
+        d, extra_attrs=extra_attrs, load_objects=load_objects
+    )
 
 
-def _parse_coco_detection_annotations(d, extra_attrs=True):
+def _parse_coco_detection_annotations(d, extra_attrs=True, load_objects=True):
     # Load info
     info = d.get("info", None)
     licenses = d.get("licenses", None)
@@ -1382,7 +1448,7 @@ def _parse_coco_detection_annotations(d, extra_attrs=True):
     images = {i["id"]: i for i in d.get("images", [])}
 
     # Load annotations
-    _annotations = d.get("annotations", None)
+    _annotations = d.get("annotations", None) if load_objects else None
     if _annotations is not None:
         annotations = defaultdict(list)
         for a in _annotations:
@@ -1430,14 +1496,13 @@ def parse_coco_categories(categories):
     supercategory_map = {}
     for cat_id in range(max(cat_map, default=-1) + 1):
         category = cat_map.get(cat_id, None)
-        try:
-            name = category["name"]
-        except:
-            name = str(cat_id)
+        if category is None:
+            classes.append(str(cat_id))
+            continue
 
+        name = category.get("name", str(cat_id))
         classes.append(name)
-        if category is not None:
-            supercategory_map[name] = category
+        supercategory_map[name] = category
 
     return classes, supercategory_map
 
@@ -1613,7 +1678,7 @@ def download_coco_dataset_split(
         # Partial image download
 
         # Load annotations to use to determine what images to use
-        d = etas.load_json(full_anno_path)
+        d = fou.read_json(full_anno_path)
         (
             _,
             all_classes,
@@ -1706,7 +1771,7 @@ def download_coco_dataset_split(
 
     if did_download:
         if d is None:
-            d = etas.load_json(full_anno_path)
+            d = fou.read_json(full_anno_path)
 
             categories = d.get("categories", None)
             if categories is not None:
@@ -1739,11 +1804,9 @@ def _merge_dir(indir, outdir):
 
 
 def _write_partial_annotations(d, outpath, split, filenames):
-    id_map = {i["file_name"]: i["id"] for i in d["images"]}
     filenames = set(filenames)
-    image_ids = {id_map[f] for f in filenames}
-
     d["images"] = [i for i in d["images"] if i["file_name"] in filenames]
+    image_ids = {i["id"] for i in d["images"]}
 
     if split != "test":
         d["annotations"] = [
@@ -1752,7 +1815,7 @@ def _write_partial_annotations(d, outpath, split, filenames):
     else:
         d.pop("annotations", None)
 
-    etas.write_json(d, outpath)
+    fou.write_json(d, outpath)
 
 
 def _parse_label_types(label_types):
@@ -1904,10 +1967,10 @@ def _get_images_with_classes(
         if not coco_objects:
             continue
 
-        oids = set(o.category_id for o in coco_objects)
+        oids = {o.category_id for o in coco_objects}
         if class_ids.issubset(oids):
             all_ids.append(image_id)
-        elif class_ids & oids:
+        elif not class_ids.isdisjoint(oids):
             any_ids.append(image_id)
 
     return all_ids, any_ids
@@ -1954,7 +2017,7 @@ def _parse_image_ids(raw_image_ids, images, split=None):
 
 def _load_image_ids_txt(txt_path):
     with open(txt_path, "r") as f:
-        return [l.strip() for l in f.readlines()]
+        return f.read().split()
 
 
 def _load_image_ids_csv(csv_path):
@@ -1976,7 +2039,7 @@ def _load_image_ids_csv(csv_path):
 
 
 def _load_image_ids_json(json_path):
-    return [_id for _id in etas.load_json(json_path)]
+    return list(fou.read_json(json_path))
 
 
 def _make_images_list(images_dir):
@@ -2168,12 +2231,13 @@ def _coco_segmentation_to_mask(segmentation, bbox, frame_size):
         # RLE
         rle = segmentation
 
-    mask = mask_utils.decode(rle).astype(bool)
+    mask = mask_utils.decode(rle)
 
+    # Crop before casting so that only the bounding box region is copied
     return mask[
         int(round(y)) : int(round(y + h)),
         int(round(x)) : int(round(x + w)),
-    ]
+    ].astype(bool)
 
 
 def _polyline_to_coco_segmentation(polyline, frame_size, iscrowd="iscrowd"):
@@ -2228,12 +2292,16 @@ def _make_coco_keypoints(keypoint, frame_size):
 
 
 def _mask_to_rle(mask):
-    counts = []
-    for i, (value, elements) in enumerate(groupby(mask.ravel(order="F"))):
-        if i == 0 and value == 1:
-            counts.append(0)
+    values = mask.ravel(order="F")
+    if values.size == 0:
+        return {"counts": [], "size": list(mask.shape)}
 
-        counts.append(len(list(elements)))
+    # Run lengths are the distances between the indexes where values change
+    changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+    counts = np.diff(np.concatenate(([0], changes, [values.size]))).tolist()
+
+    if values[0] == 1:
+        counts.insert(0, 0)
 
     return {"counts": counts, "size": list(mask.shape)}
 
@@ -2242,11 +2310,24 @@ def _mask_to_polygons(mask, tolerance):
     if tolerance is None:
         tolerance = 2
 
+    # Only search for contours within the extent of the mask, since
+    # `find_contours()` scans the entire array
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return []
+
+    cols = np.flatnonzero(mask.any(axis=0))
+    y0, y1 = rows[0], rows[-1] + 1
+    x0, x1 = cols[0], cols[-1] + 1
+
     # Pad mask to close contours of shapes which start and end at an edge
-    padded_mask = np.pad(mask, pad_width=1, mode="constant", constant_values=0)
+    padded_mask = np.pad(
+        mask[y0:y1, x0:x1], pad_width=1, mode="constant", constant_values=0
+    )
 
     contours = measure.find_contours(padded_mask, 0.5)
-    contours = [c - 1 for c in contours]  # undo padding
+    offset = np.array([y0 - 1, x0 - 1])
+    contours = [c + offset for c in contours]  # undo cropping and padding
 
     polygons = []
     for contour in contours:
@@ -2267,8 +2348,9 @@ def _mask_to_polygons(mask, tolerance):
 
 
 def _close_contour(contour):
-    if not np.array_equal(contour[0], contour[-1]):
-        contour = np.vstack((contour, contour[0]))
+    first, last = contour[0], contour[-1]
+    if first[0] != last[0] or first[1] != last[1]:
+        contour = np.vstack((contour, contour[:1]))
 
     return contour
 
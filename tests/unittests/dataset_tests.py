@@ -47,6 +47,12 @@ class DatasetTests(unittest.TestCase):
         names = fo.list_datasets(root + "*")
         self.assertEqual(len(names), 2)
 
+        names = fo.list_datasets(root[1:] + "*")
+        self.assertEqual(len(names), 0)
+
+        names = fo.list_datasets(root)
+        self.assertListEqual(names, [root])
+
     @drop_datasets
     def test_dataset_names(self):
         dataset = fo.Dataset("test dataset names!?!")
@@ -1672,6 +1678,59 @@ class DatasetTests(unittest.TestCase):
                 ],
             )
 
+    @drop_datasets
+    def test_merge_overlapping_label_lists(self):
+        dets = [fo.Detection(label=l) for l in ("a", "b", "c", "d")]
+
+        sample1 = fo.Sample(
+            filepath="image.png",
+            ground_truth=fo.Detections(detections=dets[:3]),
+        )
+
+        dataset1 = fo.Dataset()
+        dataset1.add_sample(sample1)
+
+        # Overlaps with `dataset1` on elements 1 and 2, in a different order
+        new_dets = []
+        for det in (dets[2], dets[1], dets[3]):
+            new_det = det.copy()
+            new_det.id = det.id
+            new_det.label = det.label.upper()
+            new_dets.append(new_det)
+
+        sample2 = fo.Sample(
+            filepath="image.png",
+            ground_truth=fo.Detections(detections=new_dets),
+        )
+
+        dataset2 = fo.Dataset()
+        dataset2.add_sample(sample2)
+
+        ids = [d.id for d in dets]
+
+        d1 = dataset1.clone()
+        d1.merge_samples(dataset2, merge_lists=True, overwrite=True)
+
+        dets1 = d1.first().ground_truth.detections
+        self.assertListEqual(
+            [d.id for d in dets1], [ids[0], ids[2], ids[1], ids[3]]
+        )
+        self.assertListEqual([d.label for d in dets1], ["a", "C", "B", "D"])
+
+        d2 = dataset1.clone()
+        d2.merge_samples(dataset2, merge_lists=True, overwrite=False)
+
+        dets2 = d2.first().ground_truth.detections
+        self.assertListEqual([d.id for d in dets2], ids)
+        self.assertListEqual([d.label for d in dets2], ["a", "b", "c", "D"])
+
+        # Merging a list into itself leaves it unchanged
+        d3 = dataset1.clone()
+        d3.merge_samples(d3, merge_lists=True, overwrite=True)
+
+        dets3 = d3.first().ground_truth.detections
+        self.assertListEqual([d.id for d in dets3], ids[:3])
+
     @drop_datasets
     def test_add_collection(self):
         sample1 = fo.Sample(filepath="image.jpg", foo="bar")
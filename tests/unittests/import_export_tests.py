@@ -15,6 +15,7 @@ import numpy as np
 import pytest
 
 import eta.core.image as etai
+import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
 
@@ -1160,6 +1161,22 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
         self.assertEqual(dataset2.distinct("predictions.detections.cute"), [])
         self.assertEqual(dataset2.distinct("predictions.detections.mood"), [])
 
+        # IDs only
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+            label_types=[],
+            include_id=True,
+            label_field="coco_id",
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        self.assertListEqual(
+            sorted(dataset2.values("coco_id")),
+            list(range(1, len(dataset) + 1)),
+        )
+
         # Labels-only
 
         data_path = self.images_dir
@@ -1244,6 +1261,36 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
         # data/_images/<filename>
         self.assertEqual(len(relpath.split(os.path.sep)), 3)
 
+    @drop_datasets
+    def test_coco_detection_dataset_nan(self):
+        sample = fo.Sample(
+            filepath=self._new_image(),
+            predictions=fo.Detections(
+                detections=[
+                    fo.Detection(
+                        label="cat",
+                        bounding_box=[0.1, 0.1, 0.4, 0.4],
+                        confidence=float("nan"),
+                    ),
+                ]
+            ),
+        )
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.COCODetectionDataset,
+            label_field="predictions",
+        )
+
+        # Non-finite floats are written as `NaN`, not `null`
+        labels = etas.read_json(os.path.join(export_dir, "labels.json"))
+        self.assertTrue(np.isnan(labels["annotations"][0]["score"]))
+
     @drop_datasets
     def test_voc_detection_dataset(self):
         dataset = self._make_dataset()
@@ -5,11 +5,14 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import time
 import unittest
 
 import numpy as np
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
@@ -79,6 +82,28 @@ class CoreUtilsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fou.to_slug("a" * 101)  # too long
 
+    def test_read_write_json(self):
+        d = {
+            "images": [{"id": 1, "file_name": "image.jpg"}],
+            "annotations": [
+                {"bbox": np.array([0.5, 1.5, 2.0, 3.0]), "score": np.nan}
+            ],
+        }
+
+        with etau.TempDir() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "nested", "labels.json")
+
+            fou.write_json(d, json_path)
+            d2 = fou.read_json(json_path)
+
+        self.assertEqual(d2["images"], d["images"])
+        self.assertListEqual(
+            d2["annotations"][0]["bbox"], [0.5, 1.5, 2.0, 3.0]
+        )
+
+        # Non-finite floats are preserved rather than written as `null`
+        self.assertTrue(np.isnan(d2["annotations"][0]["score"]))
+
 
 class LabelsTests(unittest.TestCase):
     @drop_datasets
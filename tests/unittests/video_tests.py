@@ -850,6 +850,36 @@ class VideoTests(unittest.TestCase):
         self.assertEqual(len(sample1_view.frames[1].gt.detections), 1)
         self.assertEqual(len(sample1_view.frames[2].gt.detections), 0)
 
+    @drop_datasets
+    def test_video_frames_match_pushdown(self):
+        sample1 = fo.Sample(filepath="video1.mp4", tags=["a"])
+        sample1.frames[1] = fo.Frame(label="cat")
+
+        sample2 = fo.Sample(filepath="video2.mp4", tags=["b"])
+        sample2.frames[1] = fo.Frame(label="dog")
+        sample2.frames[2] = fo.Frame(label="cat")
+
+        dataset = fo.Dataset()
+        dataset.add_samples([sample1, sample2])
+
+        # Sample-level filters are applied before frames are attached
+        view = dataset.match_tags("b").match_frames(F("label") == "cat")
+        pipeline = view._pipeline(attach_frames=True)
+
+        self.assertIn("$match", pipeline[0])
+        self.assertIn("$lookup", pipeline[1])
+
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.first().filepath, sample2.filepath)
+        self.assertListEqual(list(view.first().frames.keys()), [2])
+
+        # Frame-level filters are not moved before the frames lookup
+        view = dataset.match(F("frames").length() > 1)
+        pipeline = view._pipeline(attach_frames=True)
+
+        self.assertIn("$lookup", pipeline[0])
+        self.assertEqual(len(view), 1)
+
     @drop_datasets
     def test_video_frames_merge(self):
         sample1 = fo.Sample(filepath="video1.mp4")
@@ -1340,6 +1370,122 @@ class VideoTests(unittest.TestCase):
                 ],
             )
 
+    @drop_datasets
+    def test_merge_video_frames(self):
+        sample11 = fo.Sample(filepath="video1.mp4", key="a")
+        sample11.frames[1] = fo.Frame(
+            hello="world",
+            gt=fo.Detections(detections=[fo.Detection(label="cat")]),
+        )
+
+        sample12 = fo.Sample(filepath="video2.mp4", key="b")
+        sample12.frames[1] = fo.Frame(hello="there")
+
+        dataset1 = fo.Dataset()
+        dataset1.add_samples([sample11, sample12])
+
+        common = sample11.frames[1].gt.detections[0].copy()
+        common.id = sample11.frames[1].gt.detections[0].id
+        common.label = "CAT"
+
+        # Keys match samples in `dataset1`, but filepaths do not
+        sample21 = fo.Sample(filepath="other1.mp4", key="a")
+        sample21.frames[1] = fo.Frame(
+            hello="bar",
+            gt=fo.Detections(detections=[common, fo.Detection(label="dog")]),
+        )
+        sample21.frames[2] = fo.Frame(hello="new")
+
+        sample23 = fo.Sample(filepath="other3.mp4", key="c")
+        sample23.frames[1] = fo.Frame(hello="unmatched")
+        sample23.frames[2] = fo.Frame(hello="unmatched")
+
+        dataset2 = fo.Dataset()
+        dataset2.add_samples([sample21, sample23])
+
+        # Custom `key_field`
+        d1 = dataset1.clone()
+        d1.merge_samples(dataset2, key_field="key")
+
+        self.assertEqual(len(d1), 3)
+        self.assertEqual(d1.count("frames"), 5)
+
+        sample = d1.one(F("key") == "a")
+        self.assertEqual(sample.filepath, sample21.filepath)
+        self.assertEqual(sample.frames[1].hello, "bar")
+        self.assertEqual(sample.frames[2].hello, "new")
+
+        sample = d1.one(F("key") == "c")
+        self.assertListEqual(
+            [f.hello for f in sample.frames.values()],
+            ["unmatched", "unmatched"],
+        )
+
+        # Frames of unmatched samples are not inserted
+        d2 = dataset1.clone()
+        d2.merge_samples(dataset2, key_field="key", insert_new=False)
+
+        self.assertEqual(len(d2), 2)
+        self.assertEqual(d2.count("frames"), 3)
+        self.assertEqual(d2._frame_collection.count_documents({}), 3)
+        self.assertNotIn("unmatched", d2.distinct("frames.hello"))
+
+        # Existing frames are kept, but new frames are added
+        d3 = dataset1.clone()
+        d3.merge_samples(dataset2, key_field="key", skip_existing=True)
+
+        self.assertEqual(len(d3), 3)
+        sample = d3.one(F("key") == "a")
+        self.assertEqual(sample.frames[1].hello, "world")
+        self.assertEqual(len(sample.frames[1].gt.detections), 1)
+        self.assertEqual(sample.frames[1].gt.detections[0].label, "cat")
+
+        # Frame label lists are merged by ID
+        d4 = dataset1.clone()
+        d4.merge_samples(dataset2, key_field="key", merge_lists=True)
+
+        sample = d4.one(F("key") == "a")
+        self.assertListEqual(
+            [d.label for d in sample.frames[1].gt.detections], ["CAT", "dog"]
+        )
+
+        d5 = dataset1.clone()
+        d5.merge_samples(
+            dataset2, key_field="key", merge_lists=True, overwrite=False
+        )
+
+        sample = d5.one(F("key") == "a")
+        self.assertListEqual(
+            [d.label for d in sample.frames[1].gt.detections], ["cat", "dog"]
+        )
+
+    @drop_datasets
+    def test_merge_large_video_frames(self):
+        # The frames of this video exceed the 16MB limit of a single document
+        data = "x" * 1024**2
+        num_frames = 20
+
+        sample1 = fo.Sample(filepath="video.mp4")
+        dataset1 = fo.Dataset()
+        dataset1.add_sample(sample1)
+
+        sample2 = fo.Sample(filepath="video.mp4")
+        for frame_number in range(1, num_frames + 1):
+            sample2.frames[frame_number] = fo.Frame(data=data)
+
+        dataset2 = fo.Dataset()
+        dataset2.add_sample(sample2)
+
+        dataset1.merge_samples(dataset2)
+
+        self.assertEqual(dataset1.count("frames"), num_frames)
+        self.assertEqual(
+            dataset1._frame_collection.count_documents(
+                {"_sample_id": sample1._id}
+            ),
+            num_frames,
+        )
+
     @drop_datasets
     def test_add_collection(self):
         sample1 = fo.Sample(filepath="video.mp4", foo="bar")